@@ -0,0 +1,191 @@
+import asyncio
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+
+UI_ROOT = Path(__file__).resolve().parents[2] / "basecoat-clone-ui"
+# Resolved against the context's base_url, which points at serve_ui().
+INDEX_URL = "/index.html"
+
+
+class _UIRequestHandler(SimpleHTTPRequestHandler):
+    def end_headers(self):
+        # Let Chromium's HTTP cache keep CSS/JS/fonts across navigations.
+        self.send_header("Cache-Control", "max-age=3600")
+        super().end_headers()
+
+    def log_request(self, code="-", size="-"):
+        # Drop successful request logs only; 404s and other errors still go
+        # through log_error so missing assets stay visible.
+        if isinstance(code, int) and code < 400:
+            return
+        super().log_request(code, size)
+
+
+@contextmanager
+def serve_ui():
+    # Serve basecoat-clone-ui over HTTP: file:// loads bypass the browser's
+    # HTTP cache and block the dynamic module imports in js/index.js.
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_UIRequestHandler, directory=str(UI_ROOT)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# Set to the endpoint printed by serve_browser.py to let several worker
+# processes drive the same browser instead of each launching their own.
+CDP_ENDPOINT = os.environ.get("VERIFY_CDP_ENDPOINT")
+
+
+# Switch off Chromium subsystems that schedule background work during a short
+# headless run.
+_LAUNCH_ARGS = [
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+]
+
+
+@contextmanager
+def launch_debuggable_chromium(timeout=10):
+    # Python Playwright has no launch_server(), so spawn its bundled Chromium
+    # with a DevTools port that other processes can connect_over_cdp to.
+    with sync_playwright() as p:
+        executable = p.chromium.executable_path
+    with tempfile.TemporaryDirectory() as profile:
+        proc = subprocess.Popen(
+            [executable, "--headless=new", "--remote-debugging-port=0", f"--user-data-dir={profile}", *_LAUNCH_ARGS],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            # Chromium writes the chosen port and browser path here once the
+            # DevTools server is listening.
+            port_file = Path(profile) / "DevToolsActivePort"
+            deadline = time.monotonic() + timeout
+            while True:
+                lines = port_file.read_text().split() if port_file.exists() else []
+                if len(lines) == 2:
+                    break
+                if proc.poll() is not None:
+                    raise RuntimeError(f"Chromium exited with code {proc.returncode} before DevTools was ready")
+                if time.monotonic() > deadline:
+                    raise RuntimeError("Timed out waiting for Chromium's DevTools endpoint")
+                time.sleep(0.05)
+            port, path = lines
+            yield f"ws://127.0.0.1:{port}{path}"
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+@asynccontextmanager
+async def shared_browser():
+    # One Chromium for the whole run, shared by every verification.
+    async with async_playwright() as p:
+        if CDP_ENDPOINT:
+            browser = await p.chromium.connect_over_cdp(CDP_ENDPOINT)
+        else:
+            browser = await p.chromium.launch(headless=True, args=_LAUNCH_ARGS)
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+
+_NO_MOTION_CSS = (
+    "*,*::before,*::after{"
+    "animation-duration:0s!important;animation-delay:0s!important;"
+    "transition-duration:0s!important;transition-delay:0s!important}"
+)
+
+
+async def disable_animations(page):
+    # Collapse every animation and transition to its end state so frames are
+    # deterministic and nothing needs to be waited out.
+    await page.add_style_tag(content=_NO_MOTION_CSS)
+
+
+# Looping animations (spinner, skeleton) never finish, so only wait on finite
+# ones. Cancelled transitions reject `finished`, and paused ones never settle,
+# so rejections are swallowed and the whole wait is capped.
+_SETTLED_JS = """() => Promise.race([
+    Promise.all([
+        document.fonts.ready,
+        ...document.getAnimations()
+            .filter(a => a.effect && a.effect.getComputedTiming().iterations !== Infinity)
+            .map(a => a.finished.catch(() => {})),
+    ]),
+    new Promise(resolve => setTimeout(resolve, 2000)),
+]).then(() => {})"""
+
+
+async def wait_until_settled(page):
+    # Resolve as soon as fonts are loaded and transitions are done, instead of
+    # sleeping for a fixed interval.
+    await page.evaluate(_SETTLED_JS)
+
+
+async def _warm_up(context):
+    # Load the showcase once on a throwaway page so the real verifications
+    # start with fonts and images already in the browser's caches.
+    page = await context.new_page()
+    try:
+        await page.goto(INDEX_URL, wait_until="networkidle")
+    finally:
+        await page.close()
+
+
+async def _run_one(context, verify, semaphore):
+    async with semaphore:
+        page = await context.new_page()
+        try:
+            await verify(page)
+        finally:
+            await page.close()
+
+
+async def _run_all(verifiers):
+    # Verifications are independent, so drive them concurrently, capped at
+    # the CPU count to keep render and screenshot encoding from thrashing.
+    semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+    with serve_ui() as base_url:
+        async with shared_browser() as browser:
+            # Every page loads the same static, unauthenticated origin, so one
+            # context can be shared instead of set up and torn down per check.
+            context = await browser.new_context(
+                base_url=base_url,
+                viewport={"width": 1280, "height": 900},
+                bypass_csp=True,
+            )
+            try:
+                # Priming only pays off when several verifications share the
+                # cache; with a single one it is just an extra navigation.
+                if len(verifiers) > 1:
+                    await _warm_up(context)
+                await asyncio.gather(*(_run_one(context, verify, semaphore) for verify in verifiers))
+            finally:
+                await context.close()
+
+
+def run_verifiers(*verifiers):
+    asyncio.run(_run_all(verifiers))
@@ -0,0 +1,9 @@
+from helpers import run_verifiers
+from verify_components import verify_components
+
+VERIFIERS = [
+    verify_components,
+]
+
+if __name__ == "__main__":
+    run_verifiers(*VERIFIERS)
@@ -0,0 +1,23 @@
+import os
+import signal
+import time
+
+from helpers import launch_debuggable_chromium
+
+
+def _stop(signum, frame):
+    raise KeyboardInterrupt
+
+
+if __name__ == "__main__":
+    # Stay up until signalled rather than reading stdin, which is /dev/null
+    # for a backgrounded CI step; SIGTERM (plain `kill`) unwinds like Ctrl-C.
+    signal.signal(signal.SIGTERM, _stop)
+    with launch_debuggable_chromium() as endpoint:
+        print(f"VERIFY_CDP_ENDPOINT={endpoint}", flush=True)
+        print(f"Chromium is running; stop it with Ctrl-C or `kill {os.getpid()}`.", flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
@@ -1,16 +1,13 @@
-from playwright.sync_api import sync_playwright
-import os
+from helpers import INDEX_URL, disable_animations, run_verifiers, wait_until_settled
 
-def run():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        # Get the absolute path to the index.html file
-        file_path = os.path.abspath('basecoat-clone-ui/index.html')
-        page.goto(f"file://{file_path}")
-        # Give some time for fonts and layout to settle
-        page.wait_for_timeout(1000)
-        page.screenshot(path="jules-scratch/verification/verification.png", full_page=True)
-        browser.close()
 
-run()
\ No newline at end of file
+async def verify_components(page):
+    await page.goto(INDEX_URL)
+    await disable_animations(page)
+    await wait_until_settled(page)
+    # This is the tracked golden artifact, so it stays PNG.
+    await page.screenshot(path="jules-scratch/verification/verification.png", full_page=True)
+
+
+if __name__ == "__main__":
+    run_verifiers(verify_components)